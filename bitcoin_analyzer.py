@@ -5,8 +5,16 @@ Analyzes recent Bitcoin articles and provides buy/sell recommendations
 
 import sys
 import os
+import hashlib
+import html
 import json
 import re
+import threading
+import time
+import traceback
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from datetime import date, datetime
 from typing import Optional
 from pathlib import Path
@@ -40,9 +48,236 @@ except ImportError as e:
     print(f"   Error details: {e}")
     sys.exit(1)
 
+try:
+    import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.request import ACCEPT_ENCODING
+    from urllib3.util.retry import Retry
+except ImportError:
+    print("\n❌ Missing package: requests")
+    print("   Install it with: pip install requests")
+    sys.exit(1)
+
+try:
+    from bs4 import BeautifulSoup
+except ImportError:
+    print("\n❌ Missing package: beautifulsoup4")
+    print("   Install it with: pip install beautifulsoup4")
+    sys.exit(1)
+
+try:
+    from jinja2 import Environment, FileSystemLoader
+except ImportError:
+    print("\n❌ Missing package: jinja2")
+    print("   Install it with: pip install jinja2")
+    sys.exit(1)
+
+# Optional fast HTML parsers; read_website_tool falls back to BeautifulSoup without them
+try:
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:
+    LexborHTMLParser = None
+
+try:
+    from lxml import html as lxml_html
+except ImportError:
+    lxml_html = None
+
+# Optional article extractor; pages it can't handle fall through to the HTML parsers
+try:
+    import trafilatura
+except ImportError:
+    trafilatura = None
+
+# Optional pooled HTTP client handed to litellm for the agents' API calls
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+# Optional fast JSON codec for SerpAPI payloads and the report archive
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Optional on-disk HTTP cache; without it every run goes back to the network
+try:
+    import requests_cache
+except ImportError:
+    requests_cache = None
+
+# CrewAI sends its completions through litellm, which can cache responses
+try:
+    import litellm
+except ImportError:
+    litellm = None
+
 # Load environment variables
 load_dotenv()
 
+def _enable_llm_cache() -> None:
+    """Cache agent LLM responses on disk for a day (BITCOIN_ANALYZER_LLM_CACHE=0 disables).
+
+    Re-running the crew over the same articles then replays the earlier answers
+    instead of paying for another prefill and decode per agent.
+    """
+    if litellm is None or os.getenv('BITCOIN_ANALYZER_LLM_CACHE', '1') == '0':
+        return
+    try:
+        litellm.cache = litellm.Cache(type='disk', disk_cache_dir='.llm_cache', ttl=24 * 60 * 60)
+    except Exception as e:
+        print(f"⚠️  LLM response cache disabled: {e}")
+
+_enable_llm_cache()
+
+def _configure_llm_http() -> None:
+    """Give every agent's LLM calls one pooled keep-alive HTTP client.
+
+    litellm otherwise lets each provider client build its own connection pool;
+    sharing one keeps the TLS session to the API warm across agents and turns.
+    """
+    if litellm is None or httpx is None:
+        return
+    litellm.client_session = httpx.Client(
+        limits=httpx.Limits(max_keepalive_connections=8),
+        timeout=httpx.Timeout(30.0, connect=5.0),
+    )
+
+_configure_llm_http()
+
+# Shared HTTP session so repeated tool calls reuse keep-alive connections
+# instead of paying a fresh TCP+TLS handshake per request. When requests-cache
+# is installed, SerpAPI responses are kept on disk for 15 minutes (and
+# revalidated via ETag/Last-Modified afterwards) so warm runs skip the search.
+# Article pages are never cached: storing them would make requests-cache read
+# every body in full, defeating the streamed size limits in _read_page.
+if requests_cache is not None:
+    _SESSION = requests_cache.CachedSession(
+        'http_cache',
+        backend='sqlite',
+        expire_after=900,
+        urls_expire_after={'serpapi.com': 900, '*': requests_cache.DO_NOT_CACHE},
+        ignored_parameters=['api_key'],
+    )
+else:
+    _SESSION = requests.Session()
+_ADAPTER = HTTPAdapter(
+    pool_connections=20,
+    pool_maxsize=50,
+    max_retries=Retry(total=2, backoff_factor=0.3),
+)
+_SESSION.mount('https://', _ADAPTER)
+_SESSION.mount('http://', _ADAPTER)
+_SESSION.headers.update({
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
+    # Every compression urllib3 can decode here (adds br when brotli is installed)
+    'Accept-Encoding': ACCEPT_ENCODING,
+})
+
+def _max_concurrency() -> int:
+    """Return the concurrent page fetch limit (BITCOIN_ANALYZER_MAX_CONCURRENCY, default 8)."""
+    try:
+        return max(1, int(os.getenv('BITCOIN_ANALYZER_MAX_CONCURRENCY', '8')))
+    except ValueError:
+        return 8
+
+# Article pages are prefetched in the background as soon as search results
+# arrive, so the reader agents find most of them already downloaded. Entries
+# are (started_at, future) and are dropped once older than the search cache
+# window, so a page nobody read is never served to a later run.
+_PREFETCH_POOL = ThreadPoolExecutor(max_workers=_max_concurrency(), thread_name_prefix='prefetch')
+_PREFETCH: dict = {}
+_PREFETCH_TTL = 900
+
+def _prefetch_page(url: str) -> None:
+    """Start downloading a search result page unless a fresh copy is already in flight."""
+    if not url.startswith(('http://', 'https://')):
+        return
+    entry = _PREFETCH.get(url)
+    if entry is None or time.monotonic() - entry[0] > _PREFETCH_TTL:
+        _PREFETCH[url] = (time.monotonic(), _PREFETCH_POOL.submit(_read_page, url))
+
+def _take_prefetched(url: str):
+    """Pop the prefetch future for url, or None if there is none or it went stale."""
+    entry = _PREFETCH.pop(url, None)
+    if entry is None:
+        return None
+    started_at, future = entry
+    if time.monotonic() - started_at > _PREFETCH_TTL:
+        future.cancel()
+        return None
+    return future
+
+def _clear_prefetch() -> None:
+    """Drop every prefetched page, cancelling downloads that have not started."""
+    for _, future in list(_PREFETCH.values()):
+        future.cancel()
+    _PREFETCH.clear()
+
+# Shared read-only default for nested SerpAPI lookups
+_EMPTY: dict = {}
+
+def _json_loads(data):
+    """Parse JSON text or bytes, with orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+def _response_json(response):
+    """Decode a JSON response body straight from its bytes."""
+    return _json_loads(response.content)
+
+class _SearchError(Exception):
+    """A SerpAPI failure reported back to the agent (and never cached)."""
+
+
+@lru_cache(maxsize=64)
+def _search_impl(query: str, bucket: int) -> tuple:
+    """Query SerpAPI and return (formatted results, result links).
+
+    ``bucket`` only takes part in the cache key: it changes every 15 minutes, so
+    repeated searches within that window are answered from memory.
+    """
+    serpapi_key = os.getenv('SERPER_API_KEY')  # Using SERPER_API_KEY env var name for SerpAPI key
+    if not serpapi_key or serpapi_key in ['your_serper_api_key_here', '']:
+        raise _SearchError("Error: SERPER_API_KEY not set in .env file")
+    
+    # Use SerpAPI endpoint (serpapi.com)
+    url = "https://serpapi.com/search.json"
+    params = {
+        'q': query,
+        'api_key': serpapi_key,
+        'num': 10,
+        'engine': 'google'
+    }
+    
+    response = _SESSION.get(url, params=params, timeout=15)
+    if response.status_code == 200:
+        data = _response_json(response)
+        results = []
+        links = []
+        # SerpAPI uses 'organic_results' instead of 'organic'
+        if 'organic_results' in data:
+            for item in data['organic_results']:
+                title = item.get('title', 'N/A')
+                link = item.get('link', 'N/A')
+                snippet = item.get('snippet')
+                if snippet is None:
+                    snippet = item.get('about_this_result', _EMPTY).get('source', _EMPTY).get('description', 'N/A')
+                results.append(f"Title: {title}\nURL: {link}\nSnippet: {snippet}\n")
+                links.append(link)
+        return ("\n".join(results) if results else "No results found"), tuple(links)
+    elif response.status_code == 401 or response.status_code == 403:
+        error_data = _response_json(response) if response.content else {}
+        error_msg = error_data.get('error', 'Unauthorized')
+        raise _SearchError(f"Error: SerpAPI authentication failed ({response.status_code}). Please check your SERPER_API_KEY in .env file. The key may be invalid, expired, or your account may have exceeded its quota. Visit https://serpapi.com to verify your API key. Error: {error_msg}")
+    elif response.status_code == 429:
+        raise _SearchError(f"Error: SerpAPI rate limit exceeded (429). Please wait a moment and try again, or check your quota at https://serpapi.com")
+    else:
+        error_detail = response.text[:200] if response.text else 'No details'
+        raise _SearchError(f"Error: SerpAPI returned status code {response.status_code}. Details: {error_detail}")
+
 # Create custom tools using the tool decorator
 @tool("Search the web for recent articles")
 def search_web_tool(query: str) -> str:
@@ -55,44 +290,115 @@ def search_web_tool(query: str) -> str:
         Search results as a string
     """
     try:
-        import requests
-        serpapi_key = os.getenv('SERPER_API_KEY')  # Using SERPER_API_KEY env var name for SerpAPI key
-        if not serpapi_key or serpapi_key in ['your_serper_api_key_here', '']:
-            return "Error: SERPER_API_KEY not set in .env file"
-        
-        # Use SerpAPI endpoint (serpapi.com)
-        url = "https://serpapi.com/search.json"
-        params = {
-            'q': query,
-            'api_key': serpapi_key,
-            'num': 10,
-            'engine': 'google'
-        }
-        
-        response = requests.get(url, params=params, timeout=15)
-        if response.status_code == 200:
-            data = response.json()
-            results = []
-            # SerpAPI uses 'organic_results' instead of 'organic'
-            if 'organic_results' in data:
-                for item in data['organic_results']:
-                    title = item.get('title', 'N/A')
-                    link = item.get('link', 'N/A')
-                    snippet = item.get('snippet', item.get('about_this_result', {}).get('source', {}).get('description', 'N/A'))
-                    results.append(f"Title: {title}\nURL: {link}\nSnippet: {snippet}\n")
-            return "\n".join(results) if results else "No results found"
-        elif response.status_code == 401 or response.status_code == 403:
-            error_data = response.json() if response.text else {}
-            error_msg = error_data.get('error', 'Unauthorized')
-            return f"Error: SerpAPI authentication failed ({response.status_code}). Please check your SERPER_API_KEY in .env file. The key may be invalid, expired, or your account may have exceeded its quota. Visit https://serpapi.com to verify your API key. Error: {error_msg}"
-        elif response.status_code == 429:
-            return f"Error: SerpAPI rate limit exceeded (429). Please wait a moment and try again, or check your quota at https://serpapi.com"
-        else:
-            error_detail = response.text[:200] if response.text else 'No details'
-            return f"Error: SerpAPI returned status code {response.status_code}. Details: {error_detail}"
+        results, links = _search_impl(query, int(time.time() // 900))
+    except _SearchError as e:
+        return str(e)
     except Exception as e:
         return f"Error searching: {str(e)}"
 
+    for link in links:
+        _prefetch_page(link)
+    return results
+
+_WS_RE = re.compile(r"\s+")
+_SENTENCE_SPLIT_RE = re.compile(r"(?<=[.!?])\s+")
+
+def _extract_page_text(content: bytes) -> str:
+    """Strip scripts/styles from raw page HTML and return its visible text."""
+    # A boilerplate extractor returns just the article body, skipping the
+    # navigation and footer noise a plain text dump would hand to the LLM
+    if trafilatura is not None:
+        text = trafilatura.extract(
+            content,
+            include_comments=False,
+            include_tables=False,
+            favor_precision=True,
+        )
+        if text:
+            return _WS_RE.sub(' ', text).strip()
+
+    if LexborHTMLParser is not None:
+        tree = LexborHTMLParser(content)
+        for node in tree.css('script, style, noscript'):
+            node.decompose()
+        root = tree.body or tree.root
+        return _WS_RE.sub(' ', root.text(separator=' ')).strip() if root is not None else ''
+
+    # Next best is lxml's C tree directly, with no bs4 object graph on top
+    if lxml_html is not None:
+        try:
+            doc = lxml_html.fromstring(content)
+        except Exception:
+            doc = None
+        if doc is not None:
+            for bad in doc.xpath('.//script | .//style | .//noscript'):
+                bad.drop_tree()  # unlike remove(), keeps the element's tail text
+            body = doc.find('body')
+            root = body if body is not None else doc
+            return _WS_RE.sub(' ', ' '.join(root.itertext())).strip()
+
+    # Last resort: the stdlib parser, which copes with anything
+    soup = BeautifulSoup(content, 'html.parser')
+    # Remove script and style elements
+    for script in soup(["script", "style", "noscript"]):
+        script.decompose()
+
+    # Get text content with whitespace collapsed in a single C-level pass
+    return _WS_RE.sub(' ', soup.get_text(separator=' ')).strip()
+
+# Page downloads stop, and parsing is cut off, at this many bytes: 5000 chars
+# of extracted text never need more than the first ~256KB of markup
+_MAX_PAGE_BYTES = 256 * 1024
+
+# Pages advertising a body larger than this are skipped without downloading
+_MAX_CONTENT_LENGTH = 5 * 1024 * 1024
+
+def _check_content_length(headers) -> None:
+    """Raise if the response announces a body too large to be an article page."""
+    try:
+        length = int(headers.get('Content-Length') or 0)
+    except ValueError:
+        return
+    if length > _MAX_CONTENT_LENGTH:
+        raise ValueError(f"page too large ({length} bytes)")
+
+# Parsed page text keyed on (url, content digest), so cached or unchanged
+# bodies are not run through the HTML parser again
+_PAGE_TEXT_CACHE_SIZE = 256
+_PAGE_TEXT_CACHE: OrderedDict = OrderedDict()
+_PAGE_TEXT_LOCK = threading.Lock()
+
+def _page_text(url: str, content: bytes) -> str:
+    """Return the (truncated) text of a page body, reusing earlier parses."""
+    content = content[:_MAX_PAGE_BYTES]
+    key = (url, hashlib.blake2b(content, digest_size=16).digest())
+    with _PAGE_TEXT_LOCK:
+        text = _PAGE_TEXT_CACHE.get(key)
+        if text is not None:
+            _PAGE_TEXT_CACHE.move_to_end(key)
+            return text
+
+    text = _extract_page_text(content)[:5000]  # Limit to 5000 chars
+    with _PAGE_TEXT_LOCK:
+        _PAGE_TEXT_CACHE[key] = text
+        if len(_PAGE_TEXT_CACHE) > _PAGE_TEXT_CACHE_SIZE:
+            _PAGE_TEXT_CACHE.popitem(last=False)
+    return text
+
+def _read_page(url: str) -> str:
+    """Fetch a single page over the shared session and return its text."""
+    # Stream the body and stop early: the first 256KB of a news page holds all
+    # the text we keep, and the rest is mostly inlined scripts and styles
+    with _SESSION.get(url, stream=True, timeout=10) as response:
+        response.raise_for_status()
+        _check_content_length(response.headers)
+        buf = bytearray()
+        for chunk in response.iter_content(65536):
+            buf += chunk
+            if len(buf) > _MAX_PAGE_BYTES:
+                break
+    return _page_text(url, bytes(buf))
+
 @tool("Read content from a website URL")
 def read_website_tool(url: str) -> str:
     """Read and extract content from a website URL.
@@ -104,28 +410,12 @@ def read_website_tool(url: str) -> str:
         Website content as a string
     """
     try:
-        import requests
-        from bs4 import BeautifulSoup
-        
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-        }
-        response = requests.get(url, headers=headers, timeout=10)
-        response.raise_for_status()
-        
-        soup = BeautifulSoup(response.content, 'html.parser')
-        # Remove script and style elements
-        for script in soup(["script", "style"]):
-            script.decompose()
-        
-        # Get text content
-        text = soup.get_text()
-        # Clean up whitespace
-        lines = (line.strip() for line in text.splitlines())
-        chunks = (phrase.strip() for line in lines for phrase in line.split("  "))
-        text = ' '.join(chunk for chunk in chunks if chunk)
-        
-        return text[:5000] if len(text) > 5000 else text  # Limit to 5000 chars
+        # Misses go through the prefetch pool too, so concurrent reader tasks
+        # never fetch more than BITCOIN_ANALYZER_MAX_CONCURRENCY pages at once
+        future = _take_prefetched(url)
+        if future is None:
+            future = _PREFETCH_POOL.submit(_read_page, url)
+        return future.result()
     except Exception as e:
         return f"Error reading website: {str(e)}"
 
@@ -133,6 +423,18 @@ def read_website_tool(url: str) -> str:
 search_tool = search_web_tool
 website_tool = read_website_tool
 
+# Locate the website agent's HTML: a ```html fence, any fence holding a full
+# document, or a document running to the end of the output
+_HTML_FENCE_RE = re.compile(r"```html\s*([\s\S]*?)(?:```|\Z)", re.IGNORECASE)
+_HTML_BLOCK_RE = re.compile(r"```\w*\s*(<(?:!doctype|html|body)[\s\S]*?)```", re.IGNORECASE)
+_HTML_TAIL_RE = re.compile(r"(<(?:!doctype|html)[\s\S]+)$", re.IGNORECASE)
+_CODE_FENCE_RE = re.compile(r"```(?:html)?")
+
+# Search retrieves up to 10 articles; each gets its own concurrent reader task and
+# reader agent. Slots past the end of the search results still cost one short LLM
+# call each to answer "No article."
+READER_TASK_COUNT = 10
+
 def _fallback_persona() -> dict:
     """Return the fixed AI investor profile (image stored locally in assets/)."""
     return {
@@ -198,14 +500,26 @@ def _render_archive_links(archive_items: list) -> tuple[str, str]:
     return "\n          ".join(list_items), min_date
 
 
+def _write_bytes_atomic(path, data: bytes) -> None:
+    """Write data to a sibling temp file, then swap it into place in one rename."""
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "wb", buffering=len(data) + 1) as f:
+        f.write(data)
+    os.replace(tmp_path, path)
+
+
 def _save_daily_report_files(report_data: dict, html_output: str, current_date: str) -> None:
     reports_dir = _ensure_reports_dir()
     html_path = reports_dir / f"{current_date}.html"
     json_path = reports_dir / f"{current_date}.json"
     archive_html_output = html_output.replace('href="reports/', 'href="')
 
-    html_path.write_text(archive_html_output, encoding="utf-8")
-    json_path.write_text(json.dumps(report_data, indent=2, ensure_ascii=False), encoding="utf-8")
+    _write_bytes_atomic(html_path, archive_html_output.encode("utf-8"))
+    if orjson is not None:
+        json_bytes = orjson.dumps(report_data, option=orjson.OPT_INDENT_2)
+    else:
+        json_bytes = json.dumps(report_data, indent=2, ensure_ascii=False).encode("utf-8")
+    _write_bytes_atomic(json_path, json_bytes)
 
 
 def _load_recent_report_summaries(limit: int = 7, exclude_date: Optional[str] = None) -> list:
@@ -225,7 +539,7 @@ def _load_recent_report_summaries(limit: int = 7, exclude_date: Optional[str] =
             continue
 
         try:
-            data = json.loads(json_path.read_text(encoding="utf-8"))
+            data = _json_loads(json_path.read_bytes())
         except (json.JSONDecodeError, OSError):
             continue
 
@@ -270,8 +584,211 @@ def _build_history_context(recent_reports: list) -> str:
     return "\n".join(lines[: len(recent_reports)])
 
 
-def generate_fake_investor() -> dict:
-    """Return the fixed persona profile without calling external APIs."""
+def _json_strings(value) -> list:
+    """Return the non-empty strings of a JSON list (anything else yields [])."""
+    if not isinstance(value, list):
+        return []
+    strings = []
+    for item in value:
+        if isinstance(item, (str, int, float)):
+            text = str(item).strip()
+            if text:
+                strings.append(text)
+    return strings
+
+
+def _parse_report_json(website_output: str) -> Optional[tuple]:
+    """Read (articles, analysis, synthesis, recommendation) from the website agent's JSON.
+
+    Returns None when the output holds no JSON object with any report content
+    (e.g. a stray {...} in the agent's prose), so the caller can fall back to
+    extracting the sections from HTML.
+    """
+    start = website_output.find("{")
+    end = website_output.rfind("}")
+    if start == -1 or end <= start:
+        return None
+    try:
+        data = _json_loads(website_output[start:end + 1])
+    except ValueError:
+        return None
+    if not isinstance(data, dict):
+        return None
+
+    raw_articles = data.get("articles")
+    articles = []
+    for item in raw_articles if isinstance(raw_articles, list) else []:
+        if not isinstance(item, dict):
+            continue
+        title = str(item.get("title") or "").strip()
+        if title:
+            href = str(item.get("href") or "").strip()
+            articles.append({"title": title, "href": href or None})
+
+    raw_recommendation = data.get("recommendation")
+    if not isinstance(raw_recommendation, dict):
+        raw_recommendation = {}
+    raw_lists = raw_recommendation.get("lists")
+    if not isinstance(raw_lists, list):
+        raw_lists = []
+    recommendation = {
+        "paragraphs": _json_strings(raw_recommendation.get("paragraphs")),
+        "lists": [
+            items
+            for items in (_json_strings(lst) for lst in raw_lists)
+            if items
+        ],
+    }
+
+    analysis = _json_strings(data.get("analysis"))
+    synthesis = _json_strings(data.get("synthesis"))
+    if not (articles or analysis or synthesis or recommendation["paragraphs"] or recommendation["lists"]):
+        return None
+    return articles, analysis, synthesis, recommendation
+
+
+def _extract_report_sections_lexbor(html_content: str) -> tuple:
+    """Pull the four report sections out of the website agent's HTML with selectolax."""
+    tree = LexborHTMLParser(html_content)
+    articles = []
+    analysis = []
+    synthesis = []
+    recommendation = {"paragraphs": [], "lists": []}
+
+    def read_articles(article_list) -> None:
+        for li in article_list.css("li"):
+            link = li.css_first("a")
+            title = link.text(strip=True) if link is not None else li.text(strip=True)
+            href = link.attributes.get("href") if link is not None else None
+            if title:
+                articles.append({"title": title, "href": href})
+
+    def read_analysis(section) -> None:
+        for block in section.css("article, p"):
+            text = block.text(separator=" ", strip=True)
+            if text:
+                analysis.append(text)
+
+    def read_synthesis(section) -> None:
+        for p_tag in section.css("p"):
+            text = p_tag.text(separator=" ", strip=True)
+            if text:
+                synthesis.append(text)
+
+    def read_recommendation(section) -> None:
+        for child in section.iter():
+            if child.tag == "p":
+                text = child.text(separator=" ", strip=True)
+                if text:
+                    recommendation["paragraphs"].append(text)
+            elif child.tag in ("ul", "ol"):
+                items = [li.text(separator=" ", strip=True) for li in child.css("li")]
+                if items:
+                    recommendation["lists"].append(items)
+
+    handlers = {
+        "articles-list": read_articles,
+        "article-analysis": read_analysis,
+        "market-synthesis": read_synthesis,
+        "final-recommendation": read_recommendation,
+    }
+    # One walk of the document finds every section; each handler then only
+    # touches its own subtree (popping keeps the first match per id)
+    for node in tree.css(", ".join(f"#{section_id}" for section_id in handlers)):
+        handler = handlers.pop(node.attributes.get("id"), None)
+        if handler is not None:
+            handler(node)
+
+    return articles, analysis, synthesis, recommendation
+
+
+def _extract_report_sections_soup(html_content: str) -> tuple:
+    """BeautifulSoup fallback for _extract_report_sections_lexbor."""
+    try:
+        soup = BeautifulSoup(html_content, "lxml")
+    except Exception:
+        soup = BeautifulSoup(html_content, "html.parser")
+    articles = []
+    analysis = []
+    synthesis = []
+    recommendation = {"paragraphs": [], "lists": []}
+
+    def read_articles(article_list) -> None:
+        for li in article_list.find_all("li"):
+            link = li.find("a")
+            title = link.get_text(strip=True) if link else li.get_text(strip=True)
+            href = link.get("href") if link else None
+            if title:
+                articles.append({"title": title, "href": href})
+
+    def read_analysis(section) -> None:
+        for block in section.find_all(["article", "p"]):
+            text = block.get_text(" ", strip=True)
+            if text:
+                analysis.append(text)
+
+    def read_synthesis(section) -> None:
+        for p_tag in section.find_all("p"):
+            text = p_tag.get_text(" ", strip=True)
+            if text:
+                synthesis.append(text)
+
+    def read_recommendation(section) -> None:
+        for child in section.find_all(["p", "ul", "ol"], recursive=False):
+            if child.name == "p":
+                text = child.get_text(" ", strip=True)
+                if text:
+                    recommendation["paragraphs"].append(text)
+            elif child.name in ("ul", "ol"):
+                items = [li.get_text(" ", strip=True) for li in child.find_all("li")]
+                if items:
+                    recommendation["lists"].append(items)
+
+    handlers = {
+        "articles-list": read_articles,
+        "article-analysis": read_analysis,
+        "market-synthesis": read_synthesis,
+        "final-recommendation": read_recommendation,
+    }
+    for node in soup.find_all(id=list(handlers)):
+        handler = handlers.pop(node.get("id"), None)
+        if handler is not None:
+            handler(node)
+
+    return articles, analysis, synthesis, recommendation
+
+
+def _extract_report_sections(html_content: str) -> tuple:
+    """Return (articles, analysis, synthesis, recommendation) from the report HTML."""
+    if LexborHTMLParser is not None:
+        return _extract_report_sections_lexbor(html_content)
+    return _extract_report_sections_soup(html_content)
+
+
+# Page shell for index.html and the daily archive copies lives in
+# templates/report.html.j2. The environment compiles it once and keeps it
+# cached. Autoescape stays off because the *_html/*_block values are markup
+# built in _save_html_output (which escapes the model-written text inside
+# them); the plain-text values are escaped in the template with |e.
+_TEMPLATES_DIR = Path(__file__).resolve().parent / "templates"
+_JINJA_ENV = Environment(
+    loader=FileSystemLoader(str(_TEMPLATES_DIR)),
+    autoescape=False,
+    auto_reload=False,
+    cache_size=400,
+    keep_trailing_newline=True,
+)
+
+
+@lru_cache(maxsize=1)
+def _report_template():
+    """Compile the report page on first use and hand back the same Template after."""
+    return _JINJA_ENV.get_template("report.html.j2")
+
+
+@lru_cache(maxsize=1)
+def _load_persona() -> dict:
+    """Resolve the persona and its assets directory once per process."""
     persona = _fallback_persona()
     assets_dir = Path(persona["image_src"]).parent
     if str(assets_dir) not in ("", "."):
@@ -279,29 +796,31 @@ def generate_fake_investor() -> dict:
     return persona
 
 
-class BitcoinAnalyzer:
-    def __init__(self):
-        self.setup_agents()
-        self.setup_tasks()
-        self.setup_crew()
+def generate_fake_investor() -> dict:
+    """Return the fixed persona profile without calling external APIs."""
+    return dict(_load_persona())
+
+
+@lru_cache(maxsize=1)
+def _build_agents() -> tuple:
+    """Build the CrewAI agents once per process; every analyzer shares them."""
     
-    def setup_agents(self):
-        """Initialize all CrewAI agents"""
-        
-        # Google Search Agent
-        self.search_agent = Agent(
-            role='Bitcoin News Researcher',
-            goal='Find the most recent and relevant Bitcoin articles from the past 24 hours',
-            backstory="""You are an expert researcher specializing in cryptocurrency news.
-            You excel at finding the latest, most relevant articles about Bitcoin from
-            reputable sources. You focus on recent news that could impact trading decisions.""",
-            tools=[search_tool],
-            verbose=True,
-            allow_delegation=False
-        )
-        
-        # Article Reader Agent
-        self.reader_agent = Agent(
+    # Google Search Agent
+    search_agent = Agent(
+        role='Bitcoin News Researcher',
+        goal='Find the most recent and relevant Bitcoin articles from the past 24 hours',
+        backstory="""You are an expert researcher specializing in cryptocurrency news.
+        You excel at finding the latest, most relevant articles about Bitcoin from
+        reputable sources. You focus on recent news that could impact trading decisions.""",
+        tools=[search_tool],
+        verbose=True,
+        allow_delegation=False
+    )
+    
+    # Article Reader Agents, one per reader task: the tasks run concurrently and
+    # an Agent keeps per-execution state, so they must not share one instance
+    reader_agents = tuple(
+        Agent(
             role='Article Analyst',
             goal='Extract and summarize key information from Bitcoin articles',
             backstory="""You are a skilled financial journalist with deep understanding
@@ -312,52 +831,94 @@ class BitcoinAnalyzer:
             verbose=True,
             allow_delegation=False
         )
-        
-        # Synthesis Agent
-        self.synthesis_agent = Agent(
-            role='Market Intelligence Synthesizer',
-            goal='Combine multiple article summaries into coherent market insights',
-            backstory="""You are a senior market analyst who excels at identifying patterns
-            and trends across multiple sources. You can synthesize information from various
-            articles to create a comprehensive view of the current Bitcoin market situation.""",
-            verbose=True,
-            allow_delegation=False
-        )
-        
-        # Analyst Agent
-        self.analyst_agent = Agent(
-            role='Trading Strategist',
-            goal='Provide clear buy/sell/hold recommendations based on market analysis',
-            backstory="""You are an experienced cryptocurrency trading strategist with
-            a track record of successful market predictions. You analyze market data,
-            sentiment, and trends to provide actionable trading recommendations.
-            You are conservative and base recommendations on solid evidence.""",
-            verbose=True,
-            allow_delegation=False
-        )
-        
-        # Website Agent
-        self.website_agent = Agent(
-            role='Financial News Layout Editor',
-            goal='Prepare clear sectioned HTML content for a professional financial article in the tone of major newspapers such as The New York Times.',
-            backstory="""You are a meticulous financial news layout editor. You produce semantic, well-structured HTML
-            containing only the essential sections of the Bitcoin report (Articles Found, Article Analysis & Summaries,
-            Market Synthesis, Final Trading Recommendation). Avoid decorative styling, animations, or bright colors.
-            Focus on clean markup (headings, paragraphs, lists) with informative text that can be restyled later.""",
-            verbose=True,
-            allow_delegation=False
-        )
+        for _ in range(READER_TASK_COUNT)
+    )
+    
+    # Synthesis Agent
+    synthesis_agent = Agent(
+        role='Market Intelligence Synthesizer',
+        goal='Combine multiple article summaries into coherent market insights',
+        backstory="""You are a senior market analyst who excels at identifying patterns
+        and trends across multiple sources. You can synthesize information from various
+        articles to create a comprehensive view of the current Bitcoin market situation.""",
+        verbose=True,
+        allow_delegation=False
+    )
+    
+    # Analyst Agent
+    analyst_agent = Agent(
+        role='Trading Strategist',
+        goal='Provide clear buy/sell/hold recommendations based on market analysis',
+        backstory="""You are an experienced cryptocurrency trading strategist with
+        a track record of successful market predictions. You analyze market data,
+        sentiment, and trends to provide actionable trading recommendations.
+        You are conservative and base recommendations on solid evidence.""",
+        verbose=True,
+        allow_delegation=False
+    )
+    
+    # Website Agent
+    website_agent = Agent(
+        role='Financial News Layout Editor',
+        goal='Prepare clearly sectioned content for a professional financial article in the tone of major newspapers such as The New York Times.',
+        backstory="""You are a meticulous financial news layout editor. You deliver the essential sections of the
+        Bitcoin report (Articles Found, Article Analysis & Summaries, Market Synthesis, Final Trading Recommendation)
+        as strict, machine-readable JSON that the publishing system lays out later. You never add markup, styling,
+        or commentary outside the JSON, and you write informative, data-driven text.""",
+        verbose=True,
+        allow_delegation=False
+    )
+
+    return search_agent, reader_agents, synthesis_agent, analyst_agent, website_agent
+
+
+class BitcoinAnalyzer:
+    def __init__(self):
+        self.setup_agents()
+        self.setup_tasks()
+        self.setup_crew()
+    
+    def setup_agents(self):
+        """Attach the shared CrewAI agents"""
+        (
+            self.search_agent,
+            self.reader_agents,
+            self.synthesis_agent,
+            self.analyst_agent,
+            self.website_agent,
+        ) = _build_agents()
     
     def setup_tasks(self):
         """Define tasks for each agent"""
         
-        default_topic = "Bitcoin market today trading analysis"
-        self._search_task_template = """Search for the most recent articles about: {topic}
+        # Every prompt keeps its fixed instructions first and the per-run values
+        # (topic, article number, history) last, so the shared prefix stays
+        # byte-identical across runs and the provider's prompt cache can reuse it.
+        # {topic} and {history} are filled in by CrewAI from the kickoff inputs.
+        self._search_task_template = """Search for the most recent articles about the topic below.
         Focus on articles from the past 24 hours. Retrieve up to 10 of the most relevant articles
         from reputable financial news sources, cryptocurrency news sites, and major news outlets.
-        Include article titles, URLs, and brief descriptions."""
+        Include article titles, URLs, and brief descriptions.
+
+        Topic: {topic}{history}"""
+
+        self._reader_task_template = """Using the articles found by the search agent, read the article
+        at the position given below in the search results and extract and summarize:
+        1. Main topic and key points
+        2. Price movements mentioned
+        3. Market sentiment (bullish/bearish/neutral)
+        4. Technical indicators or analysis
+        5. Major news events or catalysts
+        6. Risk factors mentioned
+
+        Create a concise summary (2-3 sentences) highlighting the most important
+        trading-relevant information. Use the website tool to fetch the full content
+        of the article URL. If the search results do not list that many articles,
+        reply "No article." without using any tools.
 
-        self._synthesis_task_base = """Using the article summaries from the reader agent, combine all
+        Article number: {index}"""
+
+        self._synthesis_task_template = """Using the article summaries from the reader agent, combine all
         summaries into a comprehensive market analysis. Identify:
         1. Common themes and patterns across articles
         2. Overall market sentiment (bullish/bearish/neutral)
@@ -366,9 +927,9 @@ class BitcoinAnalyzer:
         5. Conflicting information or uncertainties
         6. Consensus views vs. outlier opinions
 
-        Create a unified view of the current Bitcoin market situation."""
+        Create a unified view of the current Bitcoin market situation.{history}"""
 
-        self._analyst_task_base = """Based on the synthesized market analysis from the synthesis agent,
+        self._analyst_task_template = """Based on the synthesized market analysis from the synthesis agent,
         provide a clear trading recommendation for TODAY:
 
         1. Recommendation: BUY, SELL, or HOLD
@@ -379,11 +940,11 @@ class BitcoinAnalyzer:
         6. Time horizon for the recommendation
 
         Be specific and actionable. Base your recommendation on the evidence
-        from the articles analyzed."""
+        from the articles analyzed.{history}"""
 
         # Task 1: Search for recent articles
         self.search_task = Task(
-            description=self._search_task_template.format(topic=default_topic),
+            description=self._search_task_template,
             agent=self.search_agent,
             expected_output="""A list of recent Bitcoin articles with:
             - Article titles
@@ -392,34 +953,29 @@ class BitcoinAnalyzer:
             - Publication dates (if available)"""
         )
         
-        # Task 2: Read and summarize articles
-        self.reader_task = Task(
-            description="""Using the articles found by the search agent, read each article
-            and extract and summarize:
-            1. Main topic and key points
-            2. Price movements mentioned
-            3. Market sentiment (bullish/bearish/neutral)
-            4. Technical indicators or analysis
-            5. Major news events or catalysts
-            6. Risk factors mentioned
-            
-            Create concise summaries (2-3 sentences per article) highlighting
-            the most important trading-relevant information. Use the website tool
-            to fetch the full content of each article URL.""",
-            agent=self.reader_agent,
-            context=[self.search_task],
-            expected_output="""A structured summary for each article containing:
+        # Task 2: Read and summarize articles, one independent pass per search result.
+        # The passes run with async_execution so the crew reads every article at once
+        # and only waits for all of them when the synthesis task starts.
+        self.reader_tasks = [
+            Task(
+                description=self._reader_task_template.format(index=index),
+                agent=reader_agent,
+                context=[self.search_task],
+                expected_output="""A structured summary of the article containing:
             - Key points
             - Market sentiment
             - Price implications
-            - Risk factors"""
-        )
+            - Risk factors""",
+                async_execution=True
+            )
+            for index, reader_agent in enumerate(self.reader_agents, start=1)
+        ]
         
         # Task 3: Synthesize information
         self.synthesis_task = Task(
-            description=self._synthesis_task_base,
+            description=self._synthesis_task_template,
             agent=self.synthesis_agent,
-            context=[self.reader_task],
+            context=self.reader_tasks,
             expected_output="""A comprehensive synthesis report with:
             - Overall market sentiment
             - Key themes and patterns
@@ -430,7 +986,7 @@ class BitcoinAnalyzer:
         
         # Task 4: Provide trading recommendation
         self.analyst_task = Task(
-            description=self._analyst_task_base,
+            description=self._analyst_task_template,
             agent=self.analyst_agent,
             context=[self.synthesis_task],
             expected_output="""A clear trading recommendation with:
@@ -441,21 +997,21 @@ class BitcoinAnalyzer:
             - Entry/exit guidance"""
         )
         
-        # Task 5: Create structured HTML content for the report
+        # Task 5: Create structured content for the report
         self.website_task = Task(
-            description="""Produce clean, semantic HTML content (without inline styling) that contains the latest Bitcoin
-            report in clearly marked sections with the following IDs:
-            - #articles-found : includes an <h2> and an unordered list (<ul id="articles-list">) of up to 10 articles with anchors.
-            - #article-analysis : includes an <h2> and a series of <article> elements summarizing each article.
-            - #market-synthesis : includes an <h2> and several <p> elements summarising market synthesis points.
-            - #final-recommendation : includes an <h2>, paragraphs, and bullet lists describing recommendation, confidence,
-              reasons, risk factors, and suggested entry/exit points.
-            Keep the tone professional and data-driven. Avoid decorative language and do not include CSS or JavaScript.
-            The HTML will be restyled later, so focus on structure and clarity only.""",
+            description="""Produce the latest Bitcoin report as a single JSON object (no markdown, HTML, or text
+            outside the JSON) with exactly these keys:
+            - "articles": a list of up to 10 objects, each with a "title" string and an "href" string holding the article URL.
+            - "analysis": a list of strings, one short summary per article, in the same order as "articles".
+            - "synthesis": a list of strings, each a market synthesis point.
+            - "recommendation": an object with "paragraphs", a list of strings that includes a line starting
+              "Recommendation:" (BUY, SELL, or HOLD) and a line starting "Confidence:", and "lists", a list of
+              string lists covering reasons, risk factors, and suggested entry/exit points.
+            Keep the tone professional and data-driven. Avoid decorative language.""",
             agent=self.website_agent,
-            context=[self.search_task, self.reader_task, self.synthesis_task, self.analyst_task],
-            expected_output="""Semantic HTML fragment with sections #articles-found, #article-analysis, #market-synthesis,
-            and #final-recommendation, each containing descriptive headings, paragraphs, and lists with up-to-date analysis."""
+            context=[self.search_task, *self.reader_tasks, self.synthesis_task, self.analyst_task],
+            expected_output="""A JSON object with the keys "articles", "analysis", "synthesis", and "recommendation"
+            filled with up-to-date analysis."""
         )
     
     def setup_crew(self):
@@ -463,14 +1019,14 @@ class BitcoinAnalyzer:
         self.crew = Crew(
             agents=[
                 self.search_agent,
-                self.reader_agent,
+                *self.reader_agents,
                 self.synthesis_agent,
                 self.analyst_agent,
                 self.website_agent
             ],
             tasks=[
                 self.search_task,
-                self.reader_task,
+                *self.reader_tasks,
                 self.synthesis_task,
                 self.analyst_task,
                 self.website_task
@@ -481,6 +1037,8 @@ class BitcoinAnalyzer:
     
     def analyze(self, topic="Bitcoin market today"):
         """Run the analysis pipeline"""
+        # Pages prefetched for an earlier run must not leak into this one
+        _clear_prefetch()
         print(f"\n🔍 Starting analysis for: {topic}\n")
         print("=" * 60)
         
@@ -491,14 +1049,10 @@ class BitcoinAnalyzer:
         if history_context:
             history_note = "\n\nRecent Bitcoin market history from prior reports:\n" + history_context
 
-        # Update search task with the topic
-        self.search_task.description = self._search_task_template.format(topic=topic) + history_note
-        self.synthesis_task.description = self._synthesis_task_base + history_note
-        self.analyst_task.description = self._analyst_task_base + history_note
-        
-        # Execute the crew
+        # Execute the crew; the topic and history are interpolated into the task
+        # templates, so the crew itself is reused unchanged across runs
         persona = generate_fake_investor()
-        result = self.crew.kickoff()
+        result = self.crew.kickoff(inputs={"topic": topic, "history": history_note})
         
         # Extract HTML from the result and save it
         self._save_html_output(result, persona, history_context)
@@ -506,107 +1060,45 @@ class BitcoinAnalyzer:
         return result
     
     def _save_html_output(self, result, persona, history_context: str = ""):
-        """Extract and save HTML output from the website agent"""
+        """Build and save the HTML report from the website agent's output"""
         try:
             # Get the output from the website task
             # CrewAI returns the last task's output as the main result
             website_output = str(result)
-            
-            # Try to extract HTML content if it's wrapped in markdown code blocks
-            html_content = None
-            
-            # Check for HTML in markdown code blocks
-            if "```html" in website_output:
-                html_content = website_output.split("```html")[1].split("```")[0].strip()
-            elif "```" in website_output:
-                # Try to find HTML between code blocks
-                parts = website_output.split("```")
-                for part in parts:
-                    if "<html" in part.lower() or "<!doctype" in part.lower() or "<body" in part.lower():
-                        html_content = part.strip()
-                        break
+
+            # The website agent returns the report sections as JSON; only fall back
+            # to scraping them out of HTML when it answered with markup instead
+            sections = _parse_report_json(website_output)
+            if sections is None:
+                # Try to extract HTML content if it's wrapped in markdown code blocks,
+                # otherwise from a trailing document, in a single scan each
+                match = (
+                    _HTML_FENCE_RE.search(website_output)
+                    or _HTML_BLOCK_RE.search(website_output)
+                    or _HTML_TAIL_RE.search(website_output)
+                )
+                html_content = match.group(1).strip() if match else ""
+
+                # If no HTML found in code blocks, use the full output
                 if not html_content:
-                    # Check if any part looks like HTML
-                    for part in parts:
-                        if part.strip().startswith("<") and len(part.strip()) > 100:
-                            html_content = part.strip()
-                            break
-            
-            # If no HTML found in code blocks, use the full output
-            if not html_content:
-                html_content = website_output.strip()
-            
-            # Clean up any markdown formatting
-            html_content = html_content.replace("```html", "").replace("```", "").strip()
-            
-            # Ensure it's valid HTML (wrap if necessary)
-            if not html_content.strip().startswith("<!DOCTYPE") and not html_content.strip().startswith("<html"):
-                html_content = f"<!DOCTYPE html><html><body>{html_content}</body></html>"
+                    html_content = website_output.strip()
+
+                # Clean up any markdown formatting in one pass (the parser below accepts
+                # bare fragments, so there is no need to wrap them in a document)
+                html_content = _CODE_FENCE_RE.sub("", html_content).strip()
+                sections = _extract_report_sections(html_content)
+
+            articles, analysis, synthesis, recommendation = sections
 
-            from bs4 import BeautifulSoup
-            soup = BeautifulSoup(html_content, "html.parser")
             current_date = date.today().isoformat()
             archive_items = _collect_archive_items(current_date)
             archive_list_html, archive_min_date = _render_archive_links(archive_items)
 
-            def extract_articles() -> list:
-                items = []
-                article_list = soup.find(id="articles-list")
-                if article_list:
-                    for li in article_list.find_all("li"):
-                        link = li.find("a")
-                        title = link.get_text(strip=True) if link else li.get_text(strip=True)
-                        href = link.get("href") if link else None
-                        if title:
-                            items.append({"title": title, "href": href})
-                return items
-
-            def extract_analysis() -> list:
-                entries = []
-                section = soup.find(id="article-analysis")
-                if section:
-                    for block in section.find_all(["article", "p"]):
-                        text = block.get_text(" ", strip=True)
-                        if text:
-                            entries.append(text)
-                return entries
-
-            def extract_synthesis() -> list:
-                paragraphs = []
-                section = soup.find(id="market-synthesis")
-                if section:
-                    for p_tag in section.find_all("p"):
-                        text = p_tag.get_text(" ", strip=True)
-                        if text:
-                            paragraphs.append(text)
-                return paragraphs
-
-            def extract_recommendation() -> dict:
-                result_data = {"paragraphs": [], "lists": []}
-                section = soup.find(id="final-recommendation")
-                if not section:
-                    return result_data
-                for child in section.find_all(["p", "ul", "ol"], recursive=False):
-                    if child.name == "p":
-                        text = child.get_text(" ", strip=True)
-                        if text:
-                            result_data["paragraphs"].append(text)
-                    elif child.name in ("ul", "ol"):
-                        items = [li.get_text(" ", strip=True) for li in child.find_all("li")]
-                        if items:
-                            result_data["lists"].append(items)
-                return result_data
-
-            articles = extract_articles()
-            analysis = extract_analysis()
-            synthesis = extract_synthesis()
-            recommendation = extract_recommendation()
-
             def shorten_text(text: str, max_chars: int = 160) -> str:
-                cleaned = re.sub(r"\s+", " ", text or "").strip()
+                cleaned = _WS_RE.sub(" ", text or "").strip()
                 if not cleaned:
                     return ""
-                sentences = re.split(r"(?<=[.!?])\s+", cleaned)
+                sentences = _SENTENCE_SPLIT_RE.split(cleaned)
                 snippet = sentences[0] if sentences else cleaned
                 if len(snippet) > max_chars:
                     snippet = snippet[:max_chars].rsplit(" ", 1)[0] + "…"
@@ -648,9 +1140,10 @@ class BitcoinAnalyzer:
                 label = (label or "").strip()
                 return f"{label} {cleaned}" if label else cleaned
 
+            # Titles and hrefs are model-written text, so escape them for markup
             article_items_html = "\n".join(
-                f'<li><a href="{item["href"]}" target="_blank" rel="noopener noreferrer">{item["title"]}</a></li>'
-                if item["href"] else f'<li>{item["title"]}</li>'
+                f'<li><a href="{html.escape(item["href"], quote=True)}" target="_blank" rel="noopener noreferrer">{html.escape(item["title"], quote=True)}</a></li>'
+                if item["href"] else f'<li>{html.escape(item["title"], quote=True)}</li>'
                 for item in articles
             ) or '<li>No recent articles were retrieved.</li>'
 
@@ -680,14 +1173,14 @@ class BitcoinAnalyzer:
                 if not summary:
                     continue
                 title_html = (
-                    f'<a href="{article["href"]}" target="_blank" rel="noopener noreferrer">{article["title"]}</a>'
+                    f'<a href="{html.escape(article["href"], quote=True)}" target="_blank" rel="noopener noreferrer">{html.escape(article["title"], quote=True)}</a>'
                     if article["href"]
-                    else article["title"]
+                    else html.escape(article["title"], quote=True)
                 )
                 lead_in = "According to"
                 if idx < len(transition_phrases):
                     lead_in = transition_phrases[idx]
-                paragraph = f"<p class=\"analysis-entry\"><span class=\"bullet-title\">{title_html}</span>: {lead_in} {summary}</p>"
+                paragraph = f"<p class=\"analysis-entry\"><span class=\"bullet-title\">{title_html}</span>: {lead_in} {html.escape(summary)}</p>"
                 analysis_entries.append(paragraph)
 
             analysis_html = (
@@ -698,7 +1191,7 @@ class BitcoinAnalyzer:
 
             synthesis_sentences = []
             for paragraph in synthesis:
-                synthesis_sentences.extend(re.split(r"(?<=[.!?])\s+", paragraph))
+                synthesis_sentences.extend(_SENTENCE_SPLIT_RE.split(paragraph))
             synthesis_points = unique_snippets(synthesis_sentences, max_items=4)
             synthesis_points = [shorten_text(point, max_chars=220) for point in synthesis_points]
             if synthesis_points:
@@ -711,7 +1204,7 @@ class BitcoinAnalyzer:
                 ]
                 for idx, point in enumerate(synthesis_points):
                     connector = connectors[idx] if idx < len(connectors) else "Additionally,"
-                    synthesis_paragraphs.append(f"<p class=\"synthesis-entry\">{connector} {point}</p>")
+                    synthesis_paragraphs.append(f"<p class=\"synthesis-entry\">{connector} {html.escape(point)}</p>")
                 synthesis_html = "\n          ".join(synthesis_paragraphs)
             else:
                 synthesis_html = '<p class="empty-state">Market synthesis is not available.</p>'
@@ -776,7 +1269,7 @@ class BitcoinAnalyzer:
                 for part in (primary_sentence, focus_sentence, follow_sentence)
                 if part.strip()
             )
-            recommendation_block = f'<p class="recommendation-summary">{recommendation_paragraph}</p>'
+            recommendation_block = f'<p class="recommendation-summary">{html.escape(recommendation_paragraph)}</p>'
 
             synthesis_topline = synthesis_points[0] if synthesis_points else ""
 
@@ -805,428 +1298,22 @@ class BitcoinAnalyzer:
             )
             persona_image_src = persona.get("image_src") or _fallback_persona()["image_src"]
 
-            html_output = f"""<!DOCTYPE html>
-<html lang="en">
-<head>
-  <meta charset="utf-8" />
-  <meta name="viewport" content="width=device-width, initial-scale=1" />
-  <title>Bitcoin Market Analysis Report</title>
-  <style>
-    :root {{
-      color-scheme: light;
-    }}
-    body {{
-      margin: 0;
-      font-family: "Georgia", "Times New Roman", serif;
-      background-color: #f8f7f5;
-      color: #111111;
-    }}
-    a {{
-      color: #0b63ce;
-      text-decoration: none;
-    }}
-    a:hover {{
-      text-decoration: underline;
-    }}
-    .page {{
-      max-width: 760px;
-      margin: 0 auto;
-      padding: 3rem 1.5rem 4rem;
-      background-color: #ffffff;
-      min-height: 100vh;
-    }}
-    header.masthead {{
-      border-bottom: 1px solid #e0e0e0;
-      padding-bottom: 1.75rem;
-      margin-bottom: 1.75rem;
-    }}
-    header.masthead h1 {{
-      font-size: 2.4rem;
-      line-height: 1.2;
-      margin: 0 0 0.75rem 0;
-      font-weight: 700;
-      color: #111111;
-    }}
-    header.masthead p.subheading {{
-      font-size: 1.1rem;
-      line-height: 1.6;
-      color: #4a4a4a;
-      margin: 0;
-    }}
-    header.masthead p.report-date {{
-      font-size: 1rem;
-      line-height: 1.5;
-      color: #333333;
-      margin: 0.4rem 0 0;
-    }}
-    .headline-summary {{
-      display: flex;
-      flex-wrap: wrap;
-      align-items: center;
-      gap: 0.75rem;
-      margin-bottom: 1.75rem;
-    }}
-    .status-badge {{
-      display: inline-flex;
-      align-items: center;
-      padding: 0.4rem 0.85rem;
-      border-radius: 999px;
-      font-size: 0.95rem;
-      font-weight: 600;
-      letter-spacing: 0.01em;
-    }}
-    .status-recommendation {{
-      background-color: #1f5135;
-      color: #f5fff8;
-    }}
-    .status-confidence {{
-      background-color: #0c4e78;
-      color: #edf7ff;
-    }}
-    .persona-block {{
-      display: flex;
-      gap: 1.5rem;
-      border-bottom: 1px solid #e0e0e0;
-      padding-bottom: 1.75rem;
-      margin-bottom: 2rem;
-      align-items: center;
-    }}
-    .persona-block img {{
-      width: 108px;
-      height: 108px;
-      object-fit: cover;
-      border-radius: 50%;
-      background-color: #ddd;
-      flex-shrink: 0;
-    }}
-    .persona-details {{
-      display: flex;
-      flex-direction: column;
-      gap: 0.4rem;
-    }}
-    .persona-name {{
-      font-size: 1.25rem;
-      font-weight: 700;
-      color: #111111;
-    }}
-    .persona-title {{
-      font-size: 1.05rem;
-      color: #333333;
-    }}
-    .persona-bio {{
-      font-size: 1rem;
-      line-height: 1.6;
-      color: #444444;
-    }}
-    .persona-note {{
-      font-size: 0.95rem;
-      color: #666666;
-    }}
-    main {{
-      line-height: 1.65;
-    }}
-    section {{
-      margin-bottom: 2.5rem;
-    }}
-    .archive-section {{
-      border-top: 1px solid #e0e0e0;
-      padding-top: 2rem;
-    }}
-    section h2 {{
-      font-size: 1.6rem;
-      font-weight: 700;
-      color: #333333;
-      border-bottom: 1px solid #e0e0e0;
-      padding-bottom: 0.75rem;
-      margin-bottom: 1.25rem;
-    }}
-    .article-list {{
-      list-style: disc;
-      padding-left: 1.4rem;
-      margin: 0;
-    }}
-    .article-list li {{
-      margin-bottom: 0.65rem;
-      font-size: 1rem;
-    }}
-    .article-list li:hover {{
-      background-color: #f3f3f3;
-    }}
-    .article-list li a {{
-      display: inline-block;
-      padding: 0.2rem 0;
-    }}
-    .archive-note {{
-      font-size: 1rem;
-      color: #4a4a4a;
-      margin: 0 0 1rem 0;
-    }}
-    .archive-list {{
-      list-style: none;
-      padding: 0;
-      margin: 0;
-    }}
-    .archive-list li {{
-      font-size: 1rem;
-      margin-bottom: 0.4rem;
-    }}
-    .archive-list li a {{
-      color: #0b63ce;
-    }}
-    .analysis-entry {{
-      margin: 0 0 1.2rem 0;
-      font-size: 1rem;
-      line-height: 1.65;
-      color: #2f3b48;
-    }}
-    .analysis-entry .bullet-title {{
-      font-weight: 600;
-      color: #102542;
-    }}
-    .analysis-entry a {{
-      color: #0b63ce;
-    }}
-    .synthesis-entry {{
-      margin: 0 0 1.1rem 0;
-      font-size: 1rem;
-      line-height: 1.65;
-      color: #2f3b48;
-    }}
-    .recommendation-summary {{
-      font-size: 1rem;
-      line-height: 1.6;
-      color: #2f3b48;
-      margin: 0;
-    }}
-    .recommendation-box {{
-      background-color: #fafafa;
-      border: 1px solid #e0e0e0;
-      padding: 1.5rem;
-      font-size: 1rem;
-    }}
-    .email-signup {{
-      border-top: 1px solid #e0e0e0;
-      border-bottom: 1px solid #e0e0e0;
-      padding: 1.75rem 0;
-    }}
-    .email-signup h3 {{
-      font-size: 1.3rem;
-      margin-top: 0;
-      margin-bottom: 0.75rem;
-      color: #333333;
-    }}
-    .email-form {{
-      display: flex;
-      gap: 0.75rem;
-      flex-wrap: wrap;
-    }}
-    .email-form input[type="email"] {{
-      flex: 1 1 280px;
-      padding: 0.65rem 0.85rem;
-      border: 1px solid #c8c8c8;
-      border-radius: 4px;
-      font-size: 1rem;
-      font-family: "Georgia", "Times New Roman", serif;
-      color: #111111;
-      background-color: #ffffff;
-    }}
-    .email-form input[type="email"]:focus {{
-      outline: 2px solid #0b63ce;
-      outline-offset: 2px;
-    }}
-    .email-form button {{
-      padding: 0.65rem 1.4rem;
-      border: 1px solid #0b63ce;
-      background-color: #0b63ce;
-      color: #ffffff;
-      font-size: 1rem;
-      font-family: "Georgia", "Times New Roman", serif;
-      border-radius: 4px;
-      cursor: pointer;
-    }}
-    .email-form button:disabled {{
-      background-color: #9fbce0;
-      border-color: #9fbce0;
-      cursor: not-allowed;
-    }}
-    #email-message {{
-      margin-top: 0.75rem;
-      font-size: 0.95rem;
-      color: #333333;
-    }}
-    footer.disclaimer {{
-      margin-top: 3rem;
-      padding-top: 1.5rem;
-      border-top: 1px solid #e0e0e0;
-      font-size: 0.95rem;
-      color: #555555;
-      line-height: 1.6;
-    }}
-    @media (max-width: 640px) {{
-      .persona-block {{
-        flex-direction: column;
-        align-items: flex-start;
-      }}
-      .persona-block img {{
-        width: 88px;
-        height: 88px;
-      }}
-    }}
-  </style>
-</head>
-<body>
-  <div class="page">
-    <header class="masthead">
-      <h1>Bitcoin Market Analysis Report</h1>
-      <p class="subheading">Daily analysis of bitcoin price action, market flows, and key risks.</p>
-      <p class="report-date" id="report-date">Report Date: {current_date}</p>
-    </header>
-
-    <div class="headline-summary" aria-label="Today&#39;s trading stance">
-      <span class="status-badge status-recommendation">{recommendation_badge}</span>
-      <span class="status-badge status-confidence">{confidence_badge}</span>
-    </div>
-
-    <section class="persona-block" aria-label="AI Analyst Persona">
-      <img src="{persona_image_src}" alt="{persona['name']} headshot portrait" />
-      <div class="persona-details">
-        <p class="persona-name">{persona['name']}</p>
-        <p class="persona-title">{persona['title']}</p>
-        <p class="persona-bio">{persona['bio']}</p>
-        <p class="persona-note">{persona_note}</p>
-      </div>
-    </section>
-
-    <section class="archive-section" aria-label="Past Bitcoin Reports" tabindex="0">
-      <h2>Recent Reports</h2>
-      <p class="archive-note">Browse prior daily briefings for continuity in market context.</p>
-      <ul class="archive-list">
-          {archive_list_html}
-      </ul>
-    </section>
-
-    <main>
-      <section id="article-analysis" aria-label="Article Analysis and Summaries" tabindex="0">
-        <h2>Article Analysis &amp; Summaries</h2>
-        {analysis_html}
-      </section>
-
-      <section id="market-synthesis" aria-label="Complete Market Synthesis Report" tabindex="0">
-        <h2>Market Synthesis</h2>
-        {synthesis_html}
-      </section>
-
-      <section id="final-recommendation" aria-label="Final Trading Recommendation" tabindex="0">
-        <h2>Final Trading Recommendation</h2>
-        <div class="recommendation-box">
-          {recommendation_block}
-        </div>
-      </section>
-
-      <section class="email-signup" id="email-section" aria-label="Email Report Section">
-        <h3>Receive the Report</h3>
-        <p>Enter your email address to have the daily summary delivered to your inbox.</p>
-        <div class="email-form">
-          <input aria-describedby="email-message" aria-required="true" autocomplete="email" id="user-email" placeholder="Enter your email address" required type="email" />
-          <button aria-busy="false" aria-live="polite" id="send-report-btn" onclick="sendReport()" disabled>Send Report</button>
-        </div>
-        <div aria-live="assertive" id="email-message" role="alert"></div>
-      </section>
-
-      <section id="articles-found" aria-label="Articles Found" tabindex="0">
-        <h2>Articles Found</h2>
-        <ul class="article-list">
-          {article_items_html}
-        </ul>
-      </section>
-    </main>
-
-    <footer class="disclaimer">
-      <p>This report and analyst persona are AI generated for informational and educational purposes only and do not constitute financial advice. Always perform independent research or consult a licensed financial professional before making investment decisions.</p>
-    </footer>
-  </div>
-
-  <script>
-    function updateReportDate() {{
-      const dateElem = document.getElementById('report-date');
-      if (!dateElem) return;
-      const now = new Date();
-      const options = {{ year: 'numeric', month: 'long', day: 'numeric' }};
-      const formattedDate = now.toLocaleDateString('en-US', options);
-      dateElem.textContent = 'Report Date: ' + formattedDate;
-    }}
-    updateReportDate();
-
-    const emailInput = document.getElementById('user-email');
-    const sendBtn = document.getElementById('send-report-btn');
-    const emailMsg = document.getElementById('email-message');
-
-    function validateEmail(email) {{
-      const re = /^[a-zA-Z0-9._%+-]+@[a-z0-9.-]+\\.[a-z]{{2,}}$/i;
-      return re.test(String(email).toLowerCase());
-    }}
-
-    window.sendReport = async function() {{
-      const email = emailInput.value.trim();
-      if (!validateEmail(email)) {{
-        emailMsg.textContent = 'Please enter a valid email address!';
-        emailMsg.style.color = '#b70000';
-        return;
-      }}
-
-      sendBtn.disabled = true;
-      sendBtn.textContent = 'Sending...';
-      emailMsg.textContent = 'Sending report...';
-      emailMsg.style.color = '#0f3c73';
-
-      try {{
-        const response = await fetch('http://localhost:5050/send-report', {{
-          method: 'POST',
-          headers: {{
-            'Content-Type': 'application/json',
-          }},
-          body: JSON.stringify({{ email }})
-        }});
-        const data = await response.json();
-        if (data.success) {{
-          emailMsg.textContent = 'Report sent successfully!';
-          emailMsg.style.color = '#146414';
-          emailInput.value = '';
-        }} else {{
-          emailMsg.textContent = 'Error: ' + (data.error || 'Failed to send report');
-          emailMsg.style.color = '#b70000';
-        }}
-      }} catch (error) {{
-        emailMsg.textContent = 'Error: Could not connect to server. Make sure the email API is running.';
-        emailMsg.style.color = '#b70000';
-      }} finally {{
-        sendBtn.disabled = false;
-        sendBtn.textContent = 'Send Report';
-      }}
-    }};
-
-    emailInput.addEventListener('input', () => {{
-      const isValid = validateEmail(emailInput.value.trim());
-      sendBtn.disabled = !isValid;
-      if (!isValid && emailInput.value.trim().length > 0) {{
-        emailMsg.textContent = 'Please enter a valid email address!';
-        emailMsg.style.color = '#b70000';
-      }} else {{
-        emailMsg.textContent = '';
-      }}
-    }});
-
-    window.addEventListener('load', () => {{
-      emailInput.focus();
-    }});
-  </script>
-</body>
-</html>
-"""
+            html_output = _report_template().render(
+                current_date=current_date,
+                recommendation_badge=recommendation_badge,
+                confidence_badge=confidence_badge,
+                persona_image_src=persona_image_src,
+                persona=persona,
+                persona_note=persona_note,
+                archive_list_html=archive_list_html,
+                analysis_html=analysis_html,
+                synthesis_html=synthesis_html,
+                recommendation_block=recommendation_block,
+                article_items_html=article_items_html,
+            )
 
             output_path = os.path.join(os.getcwd(), "index.html")
-            with open(output_path, "w", encoding="utf-8") as f:
-                f.write(html_output)
+            _write_bytes_atomic(output_path, html_output.encode("utf-8"))
 
             _save_daily_report_files(report_data, html_output, current_date)
             
@@ -1236,10 +1323,23 @@ class BitcoinAnalyzer:
         except Exception as e:
             print(f"\n⚠️  Warning: Could not save HTML output: {e}")
             print("The analysis completed successfully, but HTML generation had an issue.")
-            import traceback
             traceback.print_exc()
 
 
+# Values that mean an API key was never filled in
+_PLACEHOLDER_KEYS = frozenset({'', 'your_openai_api_key_here', 'your_serper_api_key_here'})
+_REQUIRED_KEYS = ('OPENAI_API_KEY', 'SERPER_API_KEY')
+
+
+@lru_cache(maxsize=1)
+def get_analyzer() -> BitcoinAnalyzer:
+    """Return the process-wide analyzer, building its agents, tasks and crew once."""
+    return BitcoinAnalyzer()
+
+
+# Cached for the life of the process; call check_environment.cache_clear()
+# after changing environment variables.
+@lru_cache(maxsize=1)
 def check_environment():
     """Check if the environment is properly set up"""
     issues = []
@@ -1249,20 +1349,23 @@ def check_environment():
         issues.append(f"Python version {sys.version_info.major}.{sys.version_info.minor} is too old (need {MIN_PYTHON_VERSION[0]}.{MIN_PYTHON_VERSION[1]}+)")
     
     # Check for required API keys
-    required_keys = ['OPENAI_API_KEY', 'SERPER_API_KEY']
-    missing_keys = [key for key in required_keys if not os.getenv(key) or os.getenv(key).strip() in ['', 'your_openai_api_key_here', 'your_serper_api_key_here']]
+    environ = os.environ
+    missing_keys = [key for key in _REQUIRED_KEYS if (environ.get(key) or '').strip() in _PLACEHOLDER_KEYS]
     
     if missing_keys:
         issues.append(f"Missing API keys: {', '.join(missing_keys)}")
     
-    return len(issues) == 0, issues
+    return len(issues) == 0, tuple(issues)
+
+
+_RULE = "=" * 60
+_BANNER = f"\n{_RULE}\n🚀 Bitcoin Trading Analysis System\n{_RULE}\n"
 
 
 def main():
     """Main execution function"""
-    print("\n" + "=" * 60)
-    print("🚀 Bitcoin Trading Analysis System")
-    print("=" * 60)
+    sys.stdout.write(_BANNER)
+    sys.stdout.flush()
     
     # Check environment
     env_ok, issues = check_environment()
@@ -1289,18 +1392,15 @@ def main():
         return
     
     # Initialize analyzer
-    analyzer = BitcoinAnalyzer()
+    analyzer = get_analyzer()
     
     # Run analysis
     topic = "Bitcoin market today trading analysis"
     result = analyzer.analyze(topic)
     
-    # Display results
-    print("\n" + "=" * 60)
-    print("📊 ANALYSIS COMPLETE")
-    print("=" * 60)
-    print("\n" + str(result))
-    print("\n" + "=" * 60)
+    # Display results in a single write
+    sys.stdout.write(f"\n{_RULE}\n📊 ANALYSIS COMPLETE\n{_RULE}\n\n{result}\n\n{_RULE}\n")
+    sys.stdout.flush()
 
 
 if __name__ == "__main__":
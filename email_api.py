@@ -2,89 +2,24 @@
 API endpoint for sending Bitcoin analysis reports via email
 """
 
+import atexit
 import os
-import smtplib
 import re
 from flask import Flask, request, jsonify
 from flask_cors import CORS
-from email.mime.text import MIMEText
-from email.mime.multipart import MIMEMultipart
-from bs4 import BeautifulSoup
 from dotenv import load_dotenv
 
+from send_email import REPORT_SUBJECT, SmtpPool, clean_report_text, extract_text_from_html
+
 # Load environment variables
 load_dotenv()
 
 app = Flask(__name__)
 CORS(app)  # Allow cross-origin requests from the HTML page
 
-def extract_text_from_html(html_file):
-    """Extract and clean text content from HTML file"""
-    try:
-        with open(html_file, 'r', encoding='utf-8') as f:
-            html_content = f.read()
-        
-        soup = BeautifulSoup(html_content, 'html.parser')
-        
-        # Remove script and style elements
-        for script in soup(["script", "style"]):
-            script.decompose()
-        
-        # Get text content
-        text = soup.get_text()
-        
-        # Clean up whitespace
-        lines = (line.strip() for line in text.splitlines())
-        chunks = (phrase.strip() for line in lines for phrase in line.split("  "))
-        text = '\n'.join(chunk for chunk in chunks if chunk)
-        
-        # Remove excessive newlines
-        text = re.sub(r'\n{3,}', '\n\n', text)
-        
-        return text
-    except Exception as e:
-        print(f"Error extracting text: {e}")
-        return None
-
-def format_professional_report(raw_text):
-    """Format the extracted text in a professional Wall Street trader tone"""
-    
-    text = raw_text
-    
-    # Replace common Gen Z phrases with professional equivalents
-    replacements = {
-        'no cap': '',
-        'periodt': '',
-        'vibe check': 'Market Assessment',
-        'bestie': '',
-        'lowkey': '',
-        'highkey': '',
-        'fr fr': '',
-        'that\'s facts': '',
-        'stay woke': '',
-        'it\'s giving': 'indicating',
-        'slay': 'perform well',
-        'fire': 'strong',
-        'lit': 'active',
-        'tea': 'information',
-        'spill the tea': 'provide details',
-    }
-    
-    for slang, professional in replacements.items():
-        text = re.sub(rf'\b{re.escape(slang)}\b', professional, text, flags=re.IGNORECASE)
-    
-    # Remove emojis
-    emoji_pattern = re.compile("["
-        u"\U0001F600-\U0001F64F"  # emoticons
-        u"\U0001F300-\U0001F5FF"  # symbols & pictographs
-        u"\U0001F680-\U0001F6FF"  # transport & map symbols
-        u"\U0001F1E0-\U0001F1FF"  # flags
-        u"\U00002702-\U000027B0"
-        u"\U000024C2-\U0001F251"
-        "]+", flags=re.UNICODE)
-    text = emoji_pattern.sub('', text)
-    
-    return text
+# One Gmail session shared by every request instead of a fresh TLS login per send
+_smtp_pool = SmtpPool()
+atexit.register(_smtp_pool.close)
 
 @app.route('/send-report', methods=['POST'])
 def send_report():
@@ -118,13 +53,7 @@ def send_report():
         if not raw_text:
             return jsonify({'success': False, 'error': 'Failed to extract report content'}), 500
         
-        professional_report = format_professional_report(raw_text)
-        
-        # Create email
-        msg = MIMEMultipart()
-        msg['From'] = gmail_email
-        msg['To'] = recipient_email
-        msg['Subject'] = 'Bitcoin Trading Analysis Report - Market Intelligence'
+        professional_report = clean_report_text(raw_text)
         
         # Email body
         body = f"""BITCOIN MARKET ANALYSIS REPORT
@@ -151,14 +80,8 @@ Bitcoin Analysis System
 This report was generated automatically based on real-time market data and sentiment analysis.
 """
         
-        msg.attach(MIMEText(body, 'plain'))
-        
         # Send email
-        server = smtplib.SMTP('smtp.gmail.com', 587)
-        server.starttls()
-        server.login(gmail_email, gmail_password)
-        server.sendmail(gmail_email, recipient_email, msg.as_string())
-        server.quit()
+        _smtp_pool.send(gmail_email, gmail_password, recipient_email, REPORT_SUBJECT, body)
         
         return jsonify({'success': True, 'message': f'Report sent successfully to {recipient_email}'}), 200
         
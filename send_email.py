@@ -2,97 +2,248 @@
 Script to email the Bitcoin analysis report
 """
 
+import atexit
+import base64
+import importlib.util
+import io
 import os
-import smtplib
 import re
-from email.mime.text import MIMEText
-from bs4 import BeautifulSoup
+import smtplib
+import threading
+from email import policy
+from functools import lru_cache
 from dotenv import load_dotenv
 
+# bs4 is imported where it is used, so importing this module stays cheap.
+# lxml is only probed for here; BeautifulSoup loads it when parsing.
+_HTML_PARSER = 'lxml' if importlib.util.find_spec('lxml') is not None else 'html.parser'
+
 # Load environment variables
 load_dotenv()
 
+# Common Gen Z phrases and their professional equivalents
+SLANG_REPLACEMENTS = {
+    'no cap': '',
+    'periodt': '',
+    'vibe check': 'Market Assessment',
+    'bestie': '',
+    'lowkey': '',
+    'highkey': '',
+    'fr fr': '',
+    'that\'s facts': '',
+    'stay woke': '',
+    'it\'s giving': 'indicating',
+    'slay': 'perform well',
+    'fire': 'strong',
+    'lit': 'active',
+    'tea': 'information',
+    'spill the tea': 'provide details',
+}
+
+# Patterns are compiled once at import rather than on every report.
+# One alternation handles every phrase in a single pass; longest phrases
+# come first so "spill the tea" wins over "tea".
+_SLANG_MAP = {slang.lower(): professional for slang, professional in SLANG_REPLACEMENTS.items()}
+_SLANG_RE = re.compile(
+    r'\b(' + '|'.join(re.escape(slang) for slang in sorted(_SLANG_MAP, key=len, reverse=True)) + r')\b',
+    re.IGNORECASE,
+)
+_EMOJI_RE = re.compile("["
+    u"\U0001F600-\U0001F64F"  # emoticons
+    u"\U0001F300-\U0001F5FF"  # symbols & pictographs
+    u"\U0001F680-\U0001F6FF"  # transport & map symbols
+    u"\U0001F1E0-\U0001F1FF"  # flags
+    u"\U00002702-\U000027B0"
+    u"\U000024C2-\U0001F251"
+    "]+", flags=re.UNICODE)
+
+SMTP_HOST = 'smtp.gmail.com'
+SMTP_PORT = 587
+REPORT_SUBJECT = 'Bitcoin Trading Analysis Report - Market Intelligence'
+
+# RFC 5322 limit for a single line, excluding the CRLF
+_MAX_LINE_BYTES = 998
+
+
+def _header(name, value):
+    """Fold one header line, RFC 2047-encoding any non-ASCII text in it"""
+    return policy.SMTP.fold(name, policy.SMTP.header_factory(name, value)).encode('ascii')
+
+def build_message_bytes(sender, recipient, subject, body, eight_bit=True):
+    """Assemble a UTF-8 text/plain message as wire-ready bytes"""
+    # Send the body as 8bit when allowed, unless a line is too long for SMTP
+    payload = body.replace('\r\n', '\n').encode('utf-8')
+    if eight_bit and all(len(line) <= _MAX_LINE_BYTES for line in payload.split(b'\n')):
+        transfer_encoding = b'8bit'
+        payload = payload.replace(b'\n', b'\r\n')
+    else:
+        transfer_encoding = b'base64'
+        payload = base64.encodebytes(payload).replace(b'\n', b'\r\n')
+    headers = (
+        _header('From', sender)
+        + _header('To', recipient)
+        + _header('Subject', subject)
+        + b'MIME-Version: 1.0\r\n'
+        b'Content-Type: text/plain; charset="utf-8"\r\n'
+        b'Content-Transfer-Encoding: ' + transfer_encoding + b'\r\n'
+        b'\r\n'
+    )
+    return headers + payload
+
+def _send_message(conn, sender, recipient, subject, body):
+    """Send one message, as 8bit only when the server advertises 8BITMIME"""
+    eight_bit = conn.has_extn('8bitmime')
+    msg_bytes = build_message_bytes(sender, recipient, subject, body, eight_bit)
+    conn.sendmail(sender, recipient, msg_bytes, ['BODY=8BITMIME'] if eight_bit else [])
+
+
+class SmtpPool:
+    """Keep one authenticated SMTP session alive and reuse it across sends"""
+
+    def __init__(self, host=SMTP_HOST, port=SMTP_PORT):
+        self.host = host
+        self.port = port
+        self._conn = None
+        self._credentials = None
+        # One SMTP session cannot carry two conversations at once (Flask serves
+        # requests on several threads), so every use of it is serialized
+        self._lock = threading.Lock()
+
+    def _is_alive(self):
+        try:
+            return self._conn.noop()[0] == 250
+        except smtplib.SMTPException:
+            return False
+        except OSError:
+            return False
+
+    def _connect(self, username, password):
+        """Return a live connection, reconnecting if it dropped or the login changed"""
+        if self._conn is not None and self._credentials == (username, password) and self._is_alive():
+            return self._conn
+        self._close()
+        conn = smtplib.SMTP(self.host, self.port)
+        try:
+            conn.starttls()
+            conn.login(username, password)
+        except Exception:
+            conn.close()
+            raise
+        self._conn = conn
+        self._credentials = (username, password)
+        return conn
+
+    def send(self, username, password, recipient, subject, body):
+        """Send one message from username over the pooled session"""
+        with self._lock:
+            conn = self._connect(username, password)
+            try:
+                _send_message(conn, username, recipient, subject, body)
+            except smtplib.SMTPServerDisconnected:
+                # The server may drop an idle session between noop() and sendmail()
+                self._close()
+                conn = self._connect(username, password)
+                _send_message(conn, username, recipient, subject, body)
+
+    def close(self):
+        with self._lock:
+            self._close()
+
+    def _close(self):
+        if self._conn is None:
+            return
+        try:
+            self._conn.quit()
+        except (smtplib.SMTPException, OSError):
+            self._conn.close()
+        self._conn = None
+        self._credentials = None
+
+
+_smtp_pool = SmtpPool()
+atexit.register(_smtp_pool.close)
+
+
+@lru_cache(maxsize=8)
+def _extract_text_cached(path, mtime_ns, size):
+    """Parse and clean one version of a report file (keyed on its stat)"""
+    from bs4 import BeautifulSoup
+    
+    with open(path, 'rb') as f:
+        head = f.read(64)
+        # Bail out before parsing anything that cannot be an HTML report
+        if b'<' not in head:
+            raise ValueError(f"{path} does not look like HTML")
+        html_content = (head + f.read()).decode('utf-8', errors='replace')
+    
+    soup = BeautifulSoup(html_content, _HTML_PARSER)
+    
+    # Remove script and style elements
+    for script in soup(["script", "style"]):
+        script.decompose()
+    
+    # Get text content; inline elements stay on their line
+    text = soup.get_text()
+    
+    # Clean up whitespace, writing each non-empty line/phrase into one buffer
+    buf = io.StringIO()
+    write = buf.write
+    separator = ''
+    for line in text.splitlines():
+        for phrase in line.split("  "):
+            phrase = phrase.strip()
+            if phrase:
+                write(separator)
+                write(phrase)
+                separator = '\n'
+    
+    return buf.getvalue()
+
 def extract_text_from_html(html_file):
     """Extract and clean text content from HTML file"""
     try:
-        with open(html_file, 'r', encoding='utf-8') as f:
-            html_content = f.read()
-        
-        soup = BeautifulSoup(html_content, 'html.parser')
-        
-        # Remove script and style elements
-        for script in soup(["script", "style"]):
-            script.decompose()
-        
-        # Get text content
-        text = soup.get_text()
-        
-        # Clean up whitespace
-        lines = (line.strip() for line in text.splitlines())
-        chunks = (phrase.strip() for line in lines for phrase in line.split("  "))
-        text = '\n'.join(chunk for chunk in chunks if chunk)
-        
-        # Remove excessive newlines
-        text = re.sub(r'\n{3,}', '\n\n', text)
-        
-        return text
+        # Re-parse only when the file on disk has changed
+        stat = os.stat(html_file)
+        if stat.st_size == 0:
+            print(f"Error extracting text: {html_file} is empty")
+            return None
+        return _extract_text_cached(os.path.abspath(html_file), stat.st_mtime_ns, stat.st_size)
     except Exception as e:
         print(f"Error extracting text: {e}")
         return None
 
+def clean_report_text(raw_text):
+    """Replace Gen Z slang with professional wording and strip emojis"""
+    
+    # Replace common Gen Z phrases with professional equivalents
+    text = _SLANG_RE.sub(lambda match: _SLANG_MAP[match.group(1).lower()], raw_text)
+    
+    # Remove emojis (pure-ASCII text cannot contain any, and isascii() is O(1))
+    if not text.isascii():
+        text = _EMOJI_RE.sub('', text)
+    
+    return text
+
 def format_professional_report(raw_text):
     """Format the extracted text in a professional Wall Street trader tone"""
     
     # Remove emojis and Gen Z slang, make it professional
-    text = raw_text
-    
-    # Replace common Gen Z phrases with professional equivalents
-    replacements = {
-        'no cap': '',
-        'periodt': '',
-        'vibe check': 'Market Assessment',
-        'bestie': '',
-        'lowkey': '',
-        'highkey': '',
-        'fr fr': '',
-        'that\'s facts': '',
-        'stay woke': '',
-        'it\'s giving': 'indicating',
-        'slay': 'perform well',
-        'fire': 'strong',
-        'lit': 'active',
-        'tea': 'information',
-        'spill the tea': 'provide details',
-    }
-    
-    for slang, professional in replacements.items():
-        text = re.sub(rf'\b{re.escape(slang)}\b', professional, text, flags=re.IGNORECASE)
-    
-    # Remove emojis
-    emoji_pattern = re.compile("["
-        u"\U0001F600-\U0001F64F"  # emoticons
-        u"\U0001F300-\U0001F5FF"  # symbols & pictographs
-        u"\U0001F680-\U0001F6FF"  # transport & map symbols
-        u"\U0001F1E0-\U0001F1FF"  # flags
-        u"\U00002702-\U000027B0"
-        u"\U000024C2-\U0001F251"
-        "]+", flags=re.UNICODE)
-    text = emoji_pattern.sub('', text)
+    text = clean_report_text(raw_text)
     
     # Format as professional report
-    lines = text.split('\n')
     formatted_lines = []
+    append = formatted_lines.append
     
-    for line in lines:
+    for line in text.split('\n'):
         line = line.strip()
         if not line:
             continue
         
-        # Capitalize section headers
+        # Capitalize section headers (all-caps lines, or short "Label:" lines)
         if line.isupper() or (len(line) < 50 and ':' in line):
-            formatted_lines.append(f"\n{line.upper()}\n{'=' * len(line)}\n")
+            append(f"\n{line.upper()}\n{'=' * len(line)}\n")
         else:
-            formatted_lines.append(line)
+            append(line)
     
     return '\n'.join(formatted_lines)
 
@@ -151,19 +302,9 @@ Bitcoin Analysis System
 This report was generated automatically based on real-time market data and sentiment analysis.
 """
         
-        # Create message
-        msg = MIMEText(body, 'plain')
-        msg['From'] = gmail_email
-        msg['To'] = recipient_email
-        msg['Subject'] = 'Bitcoin Trading Analysis Report - Market Intelligence'
-        
         # Send email
         print(f"📧 Sending email to {recipient_email}...")
-        server = smtplib.SMTP('smtp.gmail.com', 587)
-        server.starttls()
-        server.login(gmail_email, gmail_password)
-        server.sendmail(gmail_email, recipient_email, msg.as_string())
-        server.quit()
+        _smtp_pool.send(gmail_email, gmail_password, recipient_email, REPORT_SUBJECT, body)
         
         print(f"✅ Email sent successfully to {recipient_email}!")
         return True